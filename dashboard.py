@@ -4,7 +4,12 @@ UK Income Tax Threshold Analysis – Interactive Dashboard
 Run with:  streamlit run dashboard.py
 """
 
+import io
+import threading
+
+import matplotlib
 import matplotlib.pyplot as plt
+import pandas as pd
 import streamlit as st
 
 from tax_analysis.tax_analysis import (
@@ -16,6 +21,9 @@ from tax_analysis.tax_analysis import (
     build_scenarios,
 )
 
+# Render straight to PNG buffers; no interactive backend is ever needed here
+matplotlib.use("Agg")
+
 st.set_page_config(
     page_title="UK Income Tax Threshold Analysis",
     layout="wide",
@@ -76,13 +84,47 @@ st.sidebar.caption(f"Base year: 2024/25 · {NUM_TAXPAYERS:,} taxpayers · {PROJE
 
 # ── Build scenarios ───────────────────────────────────────────────────────────
 
-df = build_scenarios(rpi_rate=rpi_rate, cpi_rate=cpi_rate, wage_rate=wage_rate)
 
-# ── Plot 1 – revenue by scenario ─────────────────────────────────────────────
+@st.cache_data(max_entries=128)
+def _build(rpi: float, cpi: float, wage: float) -> pd.DataFrame:
+    """Memoised build_scenarios so revisiting a slider combination skips the model entirely."""
+    return build_scenarios(rpi_rate=rpi, cpi_rate=cpi, wage_rate=wage)
 
-col1, col2 = st.columns(2)
 
-with col1:
+df = _build(rpi_rate, cpi_rate, wage_rate)
+
+# ── Plot 1 – revenue by scenario ─────────────────────────────────────────────
+# Figures are created once per server process and shared between reruns and
+# sessions: each render only swaps in the new line data and legend labels.
+# The lock stops two sessions from redrawing the same figure at once.
+
+
+def _show_figure(fig) -> None:
+    """Render ``fig`` as a 100-dpi PNG; the caller must hold the figure's lock."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
+    st.image(buf)
+
+
+@st.cache_resource
+def _revenue_figure():
+    """Create the revenue-by-scenario figure with one empty line per column."""
+    fig, ax = plt.subplots(figsize=(7, 5), constrained_layout=True)
+    lines = {
+        "Frozen Thresholds (£bn)": ax.plot([], [], marker="o", linewidth=2)[0],
+        "CPI-Uprated (£bn)": ax.plot([], [], marker="s", linewidth=2)[0],
+        "Wage-Growth-Uprated (£bn)": ax.plot([], [], marker="^", linewidth=2)[0],
+        "RPI-Uprated (£bn)": ax.plot([], [], marker="*", linewidth=2)[0],
+        "RPI Spending Baseline (£bn)": ax.plot([], [], linewidth=2, linestyle="--", color="grey")[0],
+    }
+    ax.set_xlabel("Tax Year")
+    ax.set_ylabel("Income Tax Revenue (£ billion)")
+    ax.grid(True, linestyle="--", alpha=0.6)
+    return fig, ax, lines, threading.Lock()
+
+
+def _plot_revenue(df: pd.DataFrame, cpi_rate: float, wage_rate: float, rpi_rate: float) -> None:
+    """Revenue by threshold scenario, with the RPI spending baseline."""
     st.subheader("Revenue by Threshold Scenario")
     st.caption(
         "All scenarios use the same wage growth rate — only the threshold "
@@ -90,54 +132,49 @@ with col1:
         "spending is expected to grow (RPI proxy)."
     )
 
-    fig1, ax1 = plt.subplots(figsize=(7, 5))
-    ax1.plot(
-        df["Tax Year"],
-        df["Frozen Thresholds (£bn)"],
-        marker="o",
-        linewidth=2,
-        label="Frozen Thresholds",
-    )
-    ax1.plot(
-        df["Tax Year"],
-        df["CPI-Uprated (£bn)"],
-        marker="s",
-        linewidth=2,
-        label=f"CPI-Uprated ({cpi_rate:.1%})",
-    )
-    ax1.plot(
-        df["Tax Year"],
-        df["Wage-Growth-Uprated (£bn)"],
-        marker="^",
-        linewidth=2,
-        label=f"Wage-Growth-Uprated ({wage_rate:.1%})",
-    )
-    ax1.plot(
-        df["Tax Year"],
-        df["RPI-Uprated (£bn)"],
-        marker="*",
-        linewidth=2,
-        label=f"RPI-Uprated ({rpi_rate:.1%})",
-    )
-    ax1.plot(
-        df["Tax Year"],
-        df["RPI Spending Baseline (£bn)"],
-        linewidth=2,
-        linestyle="--",
-        color="grey",
-        label=f"RPI Spending Baseline ({rpi_rate:.1%})",
-    )
-    ax1.set_xlabel("Tax Year")
-    ax1.set_ylabel("Income Tax Revenue (£ billion)")
-    ax1.legend(fontsize=9)
-    ax1.grid(True, linestyle="--", alpha=0.6)
-    plt.tight_layout()
-    st.pyplot(fig1)
-    plt.close(fig1)
+    labels = {
+        "Frozen Thresholds (£bn)": "Frozen Thresholds",
+        "CPI-Uprated (£bn)": f"CPI-Uprated ({cpi_rate:.1%})",
+        "Wage-Growth-Uprated (£bn)": f"Wage-Growth-Uprated ({wage_rate:.1%})",
+        "RPI-Uprated (£bn)": f"RPI-Uprated ({rpi_rate:.1%})",
+        "RPI Spending Baseline (£bn)": f"RPI Spending Baseline ({rpi_rate:.1%})",
+    }
+    x = range(len(df))
+
+    fig1, ax1, lines, lock = _revenue_figure()
+    with lock:
+        for column, line in lines.items():
+            line.set_data(x, df[column])
+            line.set_label(labels[column])
+        ax1.set_xticks(x, df["Tax Year"])
+        ax1.relim()
+        ax1.autoscale_view()
+        ax1.legend(fontsize=9)
+        _show_figure(fig1)
+
 
 # ── Plot 2 – revenue gap vs RPI ───────────────────────────────────────────────
 
-with col2:
+
+@st.cache_resource
+def _gap_figure():
+    """Create the revenue-vs-RPI-baseline figure with one empty line per scenario."""
+    fig, ax = plt.subplots(figsize=(7, 5), constrained_layout=True)
+    lines = {
+        "Frozen Thresholds (£bn)": ax.plot([], [], marker="o", linewidth=2)[0],
+        "CPI-Uprated (£bn)": ax.plot([], [], marker="s", linewidth=2)[0],
+        "Wage-Growth-Uprated (£bn)": ax.plot([], [], marker="^", linewidth=2)[0],
+        "RPI-Uprated (£bn)": ax.plot([], [], marker="s", linewidth=2)[0],
+    }
+    ax.axhline(0, color="black", linewidth=0.8)
+    ax.set_xlabel("Tax Year")
+    ax.set_ylabel("Revenue minus RPI Spending Baseline (£ billion)")
+    ax.grid(True, linestyle="--", alpha=0.6)
+    return fig, ax, lines, threading.Lock()
+
+
+def _plot_gap(df: pd.DataFrame, cpi_rate: float, wage_rate: float, rpi_rate: float) -> None:
+    """Each scenario's revenue minus the RPI spending baseline."""
     st.subheader("Revenue vs RPI Spending Baseline")
     st.caption(
         "Shows how much more (or less) revenue each scenario raises compared "
@@ -146,54 +183,56 @@ with col2:
     )
 
     baseline = df["RPI Spending Baseline (£bn)"]
+    labels = {
+        "Frozen Thresholds (£bn)": "Frozen Thresholds vs RPI Spending",
+        "CPI-Uprated (£bn)": f"CPI ({cpi_rate:.1%}) vs RPI ({rpi_rate:.1%}) Spending",
+        "Wage-Growth-Uprated (£bn)": f"Wage-Growth ({wage_rate:.1%}) vs RPI ({rpi_rate:.1%}) Spending",
+        "RPI-Uprated (£bn)": f"RPI ({rpi_rate:.1%}) vs RPI ({rpi_rate:.1%}) Spending",
+    }
+    x = range(len(df))
+
+    fig2, ax2, lines, lock = _gap_figure()
+    with lock:
+        for column, line in lines.items():
+            line.set_data(x, df[column] - baseline)
+            line.set_label(labels[column])
+        ax2.set_xticks(x, df["Tax Year"])
+        ax2.relim()
+        ax2.autoscale_view()
+        ax2.legend(fontsize=9)
+        _show_figure(fig2)
 
-    fig2, ax2 = plt.subplots(figsize=(7, 5))
-    ax2.plot(
-        df["Tax Year"],
-        df["Frozen Thresholds (£bn)"] - baseline,
-        marker="o",
-        linewidth=2,
-        label="Frozen Thresholds vs RPI Spending",
-    )
-    ax2.plot(
-        df["Tax Year"],
-        df["CPI-Uprated (£bn)"] - baseline,
-        marker="s",
-        linewidth=2,
-        label=f"CPI ({cpi_rate:.1%}) vs RPI ({rpi_rate:.1%}) Spending",
-    )
-    ax2.plot(
-        df["Tax Year"],
-        df["Wage-Growth-Uprated (£bn)"] - baseline,
-        marker="^",
-        linewidth=2,
-        label=f"Wage-Growth ({wage_rate:.1%}) vs RPI ({rpi_rate:.1%}) Spending",
-    )
-    ax2.plot(
-        df["Tax Year"],
-        df["RPI-Uprated (£bn)"] - baseline,
-        marker="s",
-        linewidth=2,
-        label=f"RPI ({rpi_rate:.1%}) vs RPI ({rpi_rate:.1%}) Spending",
-    )
-    ax2.axhline(0, color="black", linewidth=0.8)
-    ax2.set_xlabel("Tax Year")
-    ax2.set_ylabel("Revenue minus RPI Spending Baseline (£ billion)")
-    ax2.legend(fontsize=9)
-    ax2.grid(True, linestyle="--", alpha=0.6)
-    plt.tight_layout()
-    st.pyplot(fig2)
-    plt.close(fig2)
 
 # ── Data table ────────────────────────────────────────────────────────────────
 
-with st.expander("Show full data table"):
-    st.dataframe(df, use_container_width=True)
 
-    drag = df[["Tax Year"]].copy()
-    drag["Frozen vs CPI (£bn)"] = (df["Frozen Thresholds (£bn)"] - df["CPI-Uprated (£bn)"]).round(1)
-    drag["Frozen vs Wages (£bn)"] = (df["Frozen Thresholds (£bn)"] - df["Wage-Growth-Uprated (£bn)"]).round(1)
-    drag["Frozen vs RPI (£bn)"] = (df["Frozen Thresholds (£bn)"] - df["RPI-Uprated (£bn)"]).round(1)
+def _show_tables(df: pd.DataFrame) -> None:
+    """Full scenario table and fiscal-drag differences."""
+    st.dataframe(df.round(1), use_container_width=True)
+
+    frozen = df["Frozen Thresholds (£bn)"].to_numpy()
+    drag = pd.DataFrame(
+        {
+            "Tax Year": df["Tax Year"].to_numpy(),
+            "Frozen vs CPI (£bn)": (frozen - df["CPI-Uprated (£bn)"].to_numpy()).round(1),
+            "Frozen vs Wages (£bn)": (frozen - df["Wage-Growth-Uprated (£bn)"].to_numpy()).round(1),
+            "Frozen vs RPI (£bn)": (frozen - df["RPI-Uprated (£bn)"].to_numpy()).round(1),
+        }
+    )
 
     st.subheader("Fiscal Drag (extra revenue from frozen thresholds)")
     st.dataframe(drag, use_container_width=True)
+
+
+# ── Layout ────────────────────────────────────────────────────────────────────
+
+col1, col2 = st.columns(2)
+
+with col1:
+    _plot_revenue(df, cpi_rate, wage_rate, rpi_rate)
+
+with col2:
+    _plot_gap(df, cpi_rate, wage_rate, rpi_rate)
+
+with st.expander("Show full data table"):
+    _show_tables(df)
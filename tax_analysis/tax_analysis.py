@@ -19,8 +19,7 @@ Base year: 2024/25
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from scipy import stats
+from scipy.special import ndtr
 
 # ── Base year parameters (2024/25) ────────────────────────────────────────────
 BASE_YEAR = 2024
@@ -54,13 +53,23 @@ _MEDIAN_INCOME = 35_000
 _MEAN_INCOME = 42_000
 _LN_MU = np.log(_MEDIAN_INCOME)
 _LN_SIGMA = np.sqrt(2.0 * (np.log(_MEAN_INCOME) - _LN_MU))
-INCOME_DIST = stats.lognorm(s=_LN_SIGMA, scale=np.exp(_LN_MU))
 
-# Integration grid (base-year incomes; scaled later to account for wage growth)
+# Integration grid (base-year incomes; wage growth is applied by rescaling the
+# thresholds instead, see quadrature_revenue).
+# Points are log-spaced so that grid density follows the lognormal's support
+# rather than being spent on the sparse upper tail.
 _MAX_INCOME = 600_000  # upper bound; lognormal density is negligible above this
-_INTEGRATION_POINTS = 200_000  # number of quadrature points
-_INCOMES = np.linspace(1, _MAX_INCOME, _INTEGRATION_POINTS)
-_BASE_PDF = INCOME_DIST.pdf(_INCOMES)
+_INTEGRATION_POINTS = 5_000  # number of quadrature points
+_INCOMES = np.geomspace(1, _MAX_INCOME, _INTEGRATION_POINTS)
+# Lognormal density f(x) = exp(−(ln x − μ)² / 2σ²) / (x·σ·√(2π))
+_BASE_PDF = np.exp(-0.5 * ((np.log(_INCOMES) - _LN_MU) / _LN_SIGMA) ** 2) / (
+    _INCOMES * _LN_SIGMA * np.sqrt(2.0 * np.pi)
+)
+
+# Trapezoidal-rule weights on the non-uniform grid folded into the density, so
+# integrating is a single dot product: ∫ g(x) f(x) dx ≈ g(_INCOMES) @ _WEIGHTS
+_DX = np.diff(_INCOMES)
+_WEIGHTS = _BASE_PDF * (np.append(_DX, 0.0) + np.insert(_DX, 0, 0.0)) / 2.0
 
 
 # ── Tax calculation helpers ───────────────────────────────────────────────────
@@ -73,9 +82,7 @@ def effective_personal_allowance(income: float, pa: float) -> float:
     Above £100,000 the allowance reduces by £1 for every £2 of additional
     income, reaching zero at £100,000 + 2 × pa.
     """
-    if income <= TAPER_THRESHOLD:
-        return pa
-    reduction = (income - TAPER_THRESHOLD) / 2.0
+    reduction = max(0.0, (income - TAPER_THRESHOLD) / 2.0)
     return max(0.0, pa - reduction)
 
 
@@ -90,32 +97,61 @@ def compute_tax(income: float, pa: float, basic_limit: float, higher_limit: floa
     basic_limit  : upper limit of the basic-rate band (£)
     higher_limit : upper limit of the higher-rate band (£)
     """
+    # Straight-line max/min chain with no data-dependent branches, mirroring
+    # compute_tax_vec
     eff_pa = effective_personal_allowance(income, pa)
     taxable = max(0.0, income - eff_pa)
-    if taxable == 0.0:
-        return 0.0
+    basic_portion = min(taxable, basic_limit - pa)
+    higher_portion = min(max(0.0, taxable - basic_portion), higher_limit - basic_limit)
+    additional_portion = max(0.0, taxable - basic_portion - higher_portion)
+
+    return (
+        basic_portion * TAX_RATES["basic"]
+        + higher_portion * TAX_RATES["higher"]
+        + additional_portion * TAX_RATES["additional"]
+    )
 
-    basic_band = basic_limit - pa
-    higher_band = higher_limit - basic_limit
 
-    tax = 0.0
+def compute_tax_vec(
+    incomes: np.ndarray,
+    pa: float,
+    basic_limit: float,
+    higher_limit: float,
+    taper_threshold: float = TAPER_THRESHOLD,
+) -> np.ndarray:
+    """
+    Vectorised equivalent of :func:`compute_tax` over an array of incomes.
 
-    basic_portion = min(taxable, basic_band)
-    tax += basic_portion * TAX_RATES["basic"]
-    taxable -= basic_portion
+    Thresholds follow NumPy broadcasting, so ``pa[:, None]`` etc. of shape
+    (K, 1) against incomes of shape (N,) yields a (K, N) array of taxes.
 
-    if taxable > 0:
-        higher_portion = min(taxable, higher_band)
-        tax += higher_portion * TAX_RATES["higher"]
-        taxable -= higher_portion
+    The personal-allowance taper and each rate band are expressed with
+    ``np.minimum`` / ``np.maximum`` so the whole array is processed in a few
+    NumPy passes instead of one Python call per taxpayer.
 
-    if taxable > 0:
-        tax += taxable * TAX_RATES["additional"]
+    ``taper_threshold`` defaults to the statutory £100k; it is a parameter so
+    callers can rescale it together with the other thresholds.
+    """
+    reduction = np.maximum(0.0, (incomes - taper_threshold) * 0.5)
+    eff_pa = np.maximum(0.0, pa - reduction)
+    taxable = np.maximum(0.0, incomes - eff_pa)
 
-    return tax
+    basic_band = basic_limit - pa
+    higher_band = higher_limit - basic_limit
+
+    basic_portion = np.minimum(taxable, basic_band)
+    remainder = taxable - basic_portion
+    higher_portion = np.minimum(np.maximum(remainder, 0.0), higher_band)
+    additional_portion = np.maximum(remainder - higher_portion, 0.0)
+
+    return (
+        basic_portion * TAX_RATES["basic"]
+        + higher_portion * TAX_RATES["higher"]
+        + additional_portion * TAX_RATES["additional"]
+    )
 
 
-def total_revenue(pa: float, basic_limit: float, higher_limit: float, income_scale: float = 1.0) -> float:
+def quadrature_revenue(pa: float, basic_limit: float, higher_limit: float, income_scale: float = 1.0) -> float:
     """
     Estimate total income tax revenue (£ billion) via numerical integration.
 
@@ -126,10 +162,103 @@ def total_revenue(pa: float, basic_limit: float, higher_limit: float, income_sca
         E[tax(s·X)] = ∫ tax(s·x, pa, bl, hl) · f(x) dx
 
     over the base-year distribution f, then multiply by the number of taxpayers.
+    Tax is homogeneous of degree one in income and all thresholds (including
+    the taper), so tax(s·x, pa, bl, hl) = s · tax(x, pa/s, bl/s, hl/s) and the
+    integrand is evaluated on the unscaled grid with rescaled thresholds.
+
+    This is the brute-force reference for :func:`total_revenue`, which
+    evaluates the same integral in closed form.
+    """
+    s = float(income_scale)
+    taxes = compute_tax_vec(_INCOMES, pa / s, basic_limit / s, higher_limit / s, taper_threshold=TAPER_THRESHOLD / s)
+    expected_tax = s * (taxes @ _WEIGHTS)
+    return expected_tax * NUM_TAXPAYERS / 1e9
+
+
+def _income_at_taxable(taxable: np.ndarray, pa: np.ndarray) -> np.ndarray:
+    """
+    Return the gross income at which taxable income first reaches ``taxable``.
+
+    Inverts ``income − effective_personal_allowance(income)``, which rises at
+    a rate of 1 below the taper, 1.5 inside it and 1 again once the allowance
+    has been withdrawn completely.
+    """
+    taper_end = TAPER_THRESHOLD + 2.0 * pa
+    return np.where(
+        taxable <= TAPER_THRESHOLD - pa,
+        taxable + pa,
+        np.where(taxable <= taper_end, (taxable + pa + TAPER_THRESHOLD / 2.0) / 1.5, taxable),
+    )
+
+
+def _append_last(values: np.ndarray, fill: float) -> np.ndarray:
+    """Append ``fill`` as one extra element along the last axis of ``values``."""
+    return np.concatenate([values, np.full(values.shape[:-1] + (1,), fill)], axis=-1)
+
+
+def total_revenue(
+    pa: float | np.ndarray,
+    basic_limit: float | np.ndarray,
+    higher_limit: float | np.ndarray,
+    income_scale: float | np.ndarray = 1.0,
+) -> float | np.ndarray:
     """
-    scaled_incomes = _INCOMES * income_scale
-    taxes = np.vectorize(compute_tax)(scaled_incomes, pa, basic_limit, higher_limit)
-    expected_tax = np.trapezoid(taxes * _BASE_PDF, _INCOMES)
+    Estimate total income tax revenue (£ billion) analytically.
+
+    All arguments broadcast against one another, so passing arrays of
+    thresholds evaluates several scenarios at once and returns an array of
+    revenues with the broadcast shape.
+
+    ``income_scale`` captures cumulative wage growth relative to the base year:
+    each taxpayer's income is assumed to be ``income_scale`` times higher than
+    in the base year distribution.  Tax is piecewise-linear in income, so on
+    each segment [a, b] between kinks (band edges and the taper) with
+    tax(y) = tax(a) + m·(y − a), the lognormal X gives
+
+        E[tax(s·X); a < s·X < b] = tax(a)·P + m·(s·E[X·1{a < s·X < b}] − a·P)
+
+    where P = P(a < s·X < b) and, for X ~ LN(μ, σ),
+
+        E[X·1{X < y}] = exp(μ + σ²/2) · Φ((ln y − μ − σ²) / σ)
+
+    Summing over segments yields E[tax(s·X)] exactly, which is then
+    multiplied by the number of taxpayers.
+    """
+    pa, basic_limit, higher_limit, income_scale = (
+        np.asarray(x, dtype=float)[..., None] for x in (pa, basic_limit, higher_limit, income_scale)
+    )
+
+    # Incomes at which the marginal rate changes: where tax starts, the taper
+    # start/end and the top of the basic and higher bands
+    kinks = np.concatenate(
+        np.broadcast_arrays(
+            np.zeros_like(pa),
+            np.full_like(pa, TAPER_THRESHOLD),
+            TAPER_THRESHOLD + 2.0 * pa,
+            _income_at_taxable(np.zeros_like(pa), pa),
+            _income_at_taxable(basic_limit - pa, pa),
+            _income_at_taxable(higher_limit - pa, pa),
+        ),
+        axis=-1,
+    )
+    kinks.sort(axis=-1)
+    taxes = compute_tax_vec(kinks, pa, basic_limit, higher_limit)
+
+    # Marginal rate on each segment; everything above the last kink is additional-rate
+    widths = np.diff(kinks, axis=-1)
+    slopes = np.divide(np.diff(taxes, axis=-1), widths, out=np.zeros_like(widths), where=widths > 0)
+    slopes = _append_last(slopes, TAX_RATES["additional"])
+
+    # Lognormal CDF and partial first moment at each kink, closed off at +∞
+    with np.errstate(divide="ignore"):
+        z = (np.log(kinks / income_scale) - _LN_MU) / _LN_SIGMA
+    mean = np.exp(_LN_MU + _LN_SIGMA**2 / 2.0)
+    cdf = _append_last(ndtr(z), 1.0)
+    moment = _append_last(mean * ndtr(z - _LN_SIGMA), mean)
+    prob = np.diff(cdf, axis=-1)
+    income_mass = income_scale * np.diff(moment, axis=-1)
+
+    expected_tax = np.sum(taxes * prob + slopes * (income_mass - kinks * prob), axis=-1)
     return expected_tax * NUM_TAXPAYERS / 1e9
 
 
@@ -157,65 +286,44 @@ def build_scenarios(
     at ``rpi_rate`` each year, representing expected government expenditure growth.
 
     Returns a DataFrame with one row per tax year (including the base year).
+    Revenues are kept at full precision; round them only for display.
     """
-    # Base-year revenue: used to anchor the RPI spending growth baseline
-    base_rev = total_revenue(PERSONAL_ALLOWANCE, BASIC_RATE_LIMIT, HIGHER_RATE_LIMIT)
-
-    rows = []
-    for t in range(PROJECTION_YEARS + 1):  # t=0 is the base year 2024/25
-        year_label = f"{BASE_YEAR + t}/{str(BASE_YEAR + t + 1)[-2:]}"
-        wage_scale = (1 + wage_rate) ** t
-        inf_scale = (1 + cpi_rate) ** t
-        rpi_scale = (1 + rpi_rate) ** t
-
-        # Scenario 1: thresholds frozen at 2024/25 levels
-        rev_frozen = total_revenue(
-            PERSONAL_ALLOWANCE,
-            BASIC_RATE_LIMIT,
-            HIGHER_RATE_LIMIT,
-            income_scale=wage_scale,
-        )
-
-        # Scenario 2: thresholds uprated annually with CPI inflation
-        rev_inflation = total_revenue(
-            PERSONAL_ALLOWANCE * inf_scale,
-            BASIC_RATE_LIMIT * inf_scale,
-            HIGHER_RATE_LIMIT * inf_scale,
-            income_scale=wage_scale,
-        )
-
-        # Scenario 3: thresholds uprated annually with wage growth
-        rev_wages = total_revenue(
-            PERSONAL_ALLOWANCE * wage_scale,
-            BASIC_RATE_LIMIT * wage_scale,
-            HIGHER_RATE_LIMIT * wage_scale,
-            income_scale=wage_scale,
-        )
-
-        # Scenario 4: thresholds uprated annually with RPI inflation
-        rev_rpi = total_revenue(
-            PERSONAL_ALLOWANCE * rpi_scale,
-            BASIC_RATE_LIMIT * rpi_scale,
-            HIGHER_RATE_LIMIT * rpi_scale,
-            income_scale=wage_scale,
-        )
-
-        # RPI spending baseline: base-year revenue grown at RPI — proxy for
-        # expected government expenditure increases over time
-        rpi_spending_baseline = base_rev * rpi_scale
-
-        rows.append(
-            {
-                "Tax Year": year_label,
-                "Frozen Thresholds (£bn)": round(rev_frozen, 1),
-                "CPI-Uprated (£bn)": round(rev_inflation, 1),
-                "Wage-Growth-Uprated (£bn)": round(rev_wages, 1),
-                "RPI-Uprated (£bn)": round(rev_rpi, 1),
-                "RPI Spending Baseline (£bn)": round(rpi_spending_baseline, 1),
-            }
-        )
-
-    return pd.DataFrame(rows)
+    n_years = PROJECTION_YEARS + 1
+    years = np.arange(n_years)  # t=0 is the base year 2024/25
+    year_labels = [f"{BASE_YEAR + t}/{str(BASE_YEAR + t + 1)[-2:]}" for t in years]
+
+    # Cumulative growth factors for every year
+    wage_scales = (1 + wage_rate) ** years
+    inf_scales = (1 + cpi_rate) ** years
+    rpi_scales = (1 + rpi_rate) ** years
+
+    # Threshold uprating factor for every (year, scenario) pair:
+    #   1. frozen at 2024/25 levels  2. CPI  3. wage growth  4. RPI
+    # All scenarios share the year's wage growth, so the whole projection is a
+    # single broadcast evaluation of shape (n_years, 4).
+    uprating = np.column_stack([np.ones(n_years), inf_scales, wage_scales, rpi_scales])
+    revenues = total_revenue(
+        PERSONAL_ALLOWANCE * uprating,
+        BASIC_RATE_LIMIT * uprating,
+        HIGHER_RATE_LIMIT * uprating,
+        income_scale=wage_scales[:, None],
+    )
+
+    # RPI spending baseline: base-year revenue grown at RPI — proxy for
+    # expected government expenditure increases over time
+    base_rev = revenues[0, 0]
+    rpi_spending_baseline = base_rev * rpi_scales
+
+    return pd.DataFrame(
+        {
+            "Tax Year": year_labels,
+            "Frozen Thresholds (£bn)": revenues[:, 0],
+            "CPI-Uprated (£bn)": revenues[:, 1],
+            "Wage-Growth-Uprated (£bn)": revenues[:, 2],
+            "RPI-Uprated (£bn)": revenues[:, 3],
+            "RPI Spending Baseline (£bn)": rpi_spending_baseline,
+        }
+    )
 
 
 # ── Output helpers ────────────────────────────────────────────────────────────
@@ -231,14 +339,19 @@ def print_results(df: pd.DataFrame) -> None:
     print(f"  Annual RPI inflation:      {ANNUAL_RPI:.1%}  [spending growth proxy]")
     print(f"  Number of taxpayers:       {NUM_TAXPAYERS:,}")
     print("=" * 80)
-    print(df.to_string(index=False))
+    print(df.round(1).to_string(index=False))
     print()
 
     # Fiscal-drag columns (extra revenue because thresholds were not uprated)
-    drag = df[["Tax Year"]].copy()
-    drag["vs CPI (£bn)"] = (df["Frozen Thresholds (£bn)"] - df["CPI-Uprated (£bn)"]).round(1)
-    drag["vs Wage Growth (£bn)"] = (df["Frozen Thresholds (£bn)"] - df["Wage-Growth-Uprated (£bn)"]).round(1)
-    drag["vs RPI (£bn)"] = (df["Frozen Thresholds (£bn)"] - df["RPI-Uprated (£bn)"]).round(1)
+    frozen = df["Frozen Thresholds (£bn)"].to_numpy()
+    drag = pd.DataFrame(
+        {
+            "Tax Year": df["Tax Year"].to_numpy(),
+            "vs CPI (£bn)": (frozen - df["CPI-Uprated (£bn)"].to_numpy()).round(1),
+            "vs Wage Growth (£bn)": (frozen - df["Wage-Growth-Uprated (£bn)"].to_numpy()).round(1),
+            "vs RPI (£bn)": (frozen - df["RPI-Uprated (£bn)"].to_numpy()).round(1),
+        }
+    )
 
     print("Fiscal Drag (extra revenue from frozen thresholds vs each scenario):")
     print(drag.to_string(index=False))
@@ -247,6 +360,8 @@ def print_results(df: pd.DataFrame) -> None:
 
 def plot_results(df: pd.DataFrame, output_path: str = "tax_revenue_scenarios.png") -> None:
     """Save a line chart comparing the three scenarios with an RPI spending baseline."""
+    import matplotlib.pyplot as plt  # deferred: only the CLI draws charts
+
     fig, ax = plt.subplots(figsize=(10, 6))
 
     ax.plot(df["Tax Year"], df["Frozen Thresholds (£bn)"], marker="o", linewidth=2, label="Frozen Thresholds")
@@ -284,6 +399,8 @@ def plot_rpi_comparison(
     A positive value means the scenario raises *more* revenue than spending is
     expected to increase; a negative value means revenue lags behind spending.
     """
+    import matplotlib.pyplot as plt  # deferred: only the CLI draws charts
+
     fig, ax = plt.subplots(figsize=(10, 6))
 
     baseline = df["RPI Spending Baseline (£bn)"]
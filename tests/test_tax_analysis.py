@@ -3,7 +3,9 @@ Unit tests for tax_analysis.py
 """
 
 import math
+import numpy as np
 import pandas as pd
+import pytest
 
 from tax_analysis.tax_analysis import (
     PERSONAL_ALLOWANCE,
@@ -14,7 +16,9 @@ from tax_analysis.tax_analysis import (
     ANNUAL_RPI,
     effective_personal_allowance,
     compute_tax,
+    compute_tax_vec,
     total_revenue,
+    quadrature_revenue,
     build_scenarios,
     PROJECTION_YEARS,
 )
@@ -96,6 +100,37 @@ class TestComputeTax:
         assert tax_uprated < tax_frozen
 
 
+# ── compute_tax_vec ───────────────────────────────────────────────────────────
+
+
+class TestComputeTaxVec:
+    def test_matches_scalar_compute_tax(self):
+        """The vectorised kernel should agree with compute_tax across every band and the taper."""
+        incomes = np.array([0, 10_000, PERSONAL_ALLOWANCE, 30_000, 60_270, 99_999, 110_000, 125_140, 145_140, 500_000])
+        expected = [compute_tax(x, PERSONAL_ALLOWANCE, BASIC_RATE_LIMIT, HIGHER_RATE_LIMIT) for x in incomes]
+        result = compute_tax_vec(incomes, PERSONAL_ALLOWANCE, BASIC_RATE_LIMIT, HIGHER_RATE_LIMIT)
+        np.testing.assert_allclose(result, expected, atol=1e-6)
+
+    def test_returns_array_of_same_shape(self):
+        incomes = np.linspace(1, 200_000, 50)
+        result = compute_tax_vec(incomes, PERSONAL_ALLOWANCE, BASIC_RATE_LIMIT, HIGHER_RATE_LIMIT)
+        assert result.shape == incomes.shape
+
+    def test_scaling_income_equals_rescaling_thresholds(self):
+        """tax(s·x) = s·tax(x) with every threshold, including the taper, divided by s."""
+        incomes = np.linspace(1, 300_000, 101)
+        scale = 1.25
+        direct = compute_tax_vec(incomes * scale, PERSONAL_ALLOWANCE, BASIC_RATE_LIMIT, HIGHER_RATE_LIMIT)
+        rescaled = scale * compute_tax_vec(
+            incomes,
+            PERSONAL_ALLOWANCE / scale,
+            BASIC_RATE_LIMIT / scale,
+            HIGHER_RATE_LIMIT / scale,
+            taper_threshold=TAPER_THRESHOLD / scale,
+        )
+        np.testing.assert_allclose(direct, rescaled, atol=1e-6)
+
+
 # ── total_revenue ─────────────────────────────────────────────────────────────
 
 
@@ -133,6 +168,33 @@ class TestTotalRevenue:
         )
         assert rev_frozen > rev_uprated
 
+    def test_batched_thresholds_match_individual_calls(self):
+        """Array-valued thresholds should give the same revenues as one call per scenario."""
+        uprating = np.array([1.0, 1.025, 1.04])
+        batched = total_revenue(
+            PERSONAL_ALLOWANCE * uprating, BASIC_RATE_LIMIT * uprating, HIGHER_RATE_LIMIT * uprating, income_scale=1.04
+        )
+        expected = [
+            total_revenue(PERSONAL_ALLOWANCE * u, BASIC_RATE_LIMIT * u, HIGHER_RATE_LIMIT * u, income_scale=1.04)
+            for u in uprating
+        ]
+        np.testing.assert_allclose(batched, expected)
+
+    @pytest.mark.parametrize(
+        "pa, basic_limit, higher_limit, income_scale",
+        [
+            (PERSONAL_ALLOWANCE, BASIC_RATE_LIMIT, HIGHER_RATE_LIMIT, 1.0),
+            (PERSONAL_ALLOWANCE, BASIC_RATE_LIMIT, HIGHER_RATE_LIMIT, 1.3),
+            (PERSONAL_ALLOWANCE * 1.2, BASIC_RATE_LIMIT * 1.2, HIGHER_RATE_LIMIT * 1.2, 1.2),
+            (20_000, 110_000, 150_000, 1.0),  # basic band ends inside the taper
+        ],
+    )
+    def test_matches_numerical_integration(self, pa, basic_limit, higher_limit, income_scale):
+        """The closed-form revenue should agree with brute-force quadrature over the income grid."""
+        analytic = total_revenue(pa, basic_limit, higher_limit, income_scale=income_scale)
+        numerical = quadrature_revenue(pa, basic_limit, higher_limit, income_scale=income_scale)
+        assert math.isclose(analytic, numerical, rel_tol=1e-3)
+
 
 # ── build_scenarios ───────────────────────────────────────────────────────────
 